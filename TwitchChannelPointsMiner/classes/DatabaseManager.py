@@ -4,6 +4,7 @@ import logging
 import os
 import requests
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Optional, Dict, Any
 from supabase import create_client, Client
@@ -483,13 +484,16 @@ class DatabaseManager:
             self.current_campaign_name = campaign_name
             self.expected_drops = expected_drops
             
+            # One timestamp for every row written below
+            now = datetime.now(timezone.utc).isoformat()
+            
             # Insert into in_progress table with campaign_id
             data = {
                 "account_id": account_id,
                 "username": self.current_account["username"],
                 "access_token": self.current_account["access_token"],
                 "user_id": self.current_account["user_id"],
-                "started_at": datetime.now(timezone.utc).isoformat(),
+                "started_at": now,
                 "process_id": process_id,
                 "drop_campaign": campaign_name,
                 "campaign_id": campaign_id
@@ -505,8 +509,8 @@ class DatabaseManager:
                     "account_id": account_id,
                     "campaign_id": campaign_id,
                     "status": "in_progress",
-                    "started_at": datetime.now(timezone.utc).isoformat(),
-                    "last_progress_update": datetime.now(timezone.utc).isoformat()
+                    "started_at": now,
+                    "last_progress_update": now
                 }
                 
                 # Upsert campaign progress
@@ -639,14 +643,15 @@ class DatabaseManager:
                 return False
             
             # Update campaign progress
+            now = datetime.now(timezone.utc).isoformat()
             self.client.table("account_campaign_progress") \
                 .upsert({
                     "account_id": account_id,
                     "campaign_id": campaign_id,
                     "status": "completed",
-                    "completed_at": datetime.now(timezone.utc).isoformat(),
+                    "completed_at": now,
                     "drops_claimed": drops_claimed,
-                    "last_progress_update": datetime.now(timezone.utc).isoformat()
+                    "last_progress_update": now
                 }) \
                 .execute()
             
@@ -733,6 +738,23 @@ class DatabaseManager:
             logger.error(f"Error getting campaign stats: {e}")
             return self._manual_campaign_stats(campaign_id)
     
+    def get_campaign_stats_many(self, campaign_ids: list) -> Dict[int, Dict[str, int]]:
+        """
+        Get statistics for several campaigns, fetching them concurrently.
+        
+        Args:
+            campaign_ids: IDs of the campaigns
+            
+        Returns:
+            Dict mapping each campaign ID to its stats
+        """
+        if not campaign_ids:
+            return {}
+        
+        with ThreadPoolExecutor(max_workers=min(len(campaign_ids), 8)) as executor:
+            results = executor.map(self.get_campaign_stats, campaign_ids)
+            return dict(zip(campaign_ids, results))
+    
     def _manual_campaign_stats(self, campaign_id: int) -> Dict[str, int]:
         """Manual fallback for campaign stats."""
         try:
@@ -814,6 +836,25 @@ class DatabaseManager:
         Returns:
             List of accounts with their campaign completions
         """
+        try:
+            # Try to use the stored function first (one round trip)
+            response = self.client.rpc(
+                "accounts_with_drops_agg",
+                {"p_exclude_sold": exclude_sold}
+            ).execute()
+            
+            if response.data is not None:
+                return response.data
+            
+            # Fallback to manual aggregation
+            return self._manual_accounts_with_drops(exclude_sold)
+            
+        except Exception as e:
+            logger.debug(f"accounts_with_drops_agg unavailable, aggregating manually: {e}")
+            return self._manual_accounts_with_drops(exclude_sold)
+    
+    def _manual_accounts_with_drops(self, exclude_sold: bool = True) -> list:
+        """Manual fallback for accounts with drops."""
         try:
             # First check if account_campaign_progress table exists
             try:
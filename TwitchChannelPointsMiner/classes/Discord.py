@@ -10,7 +10,7 @@ class Discord(object):
 
     def __init__(self, webhook_api: str, events: list):
         self.webhook_api = webhook_api
-        self.events = [str(e) for e in events]
+        self.events = frozenset(str(e) for e in events)
 
     def send(self, message: str, event: Events) -> None:
         if str(event) in self.events:
@@ -10,7 +10,7 @@ class Gotify(object):
     def __init__(self, endpoint: str, priority: int, events: list):
         self.endpoint = endpoint
         self.priority = priority
-        self.events = [str(e) for e in events]
+        self.events = frozenset(str(e) for e in events)
 
     def send(self, message: str, event: Events) -> None:
         if str(event) in self.events:
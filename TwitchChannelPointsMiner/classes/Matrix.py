@@ -6,6 +6,8 @@ from urllib.parse import quote
 
 from TwitchChannelPointsMiner.classes.Settings import Events
 
+logger = logging.getLogger(__name__)
+
 
 class Matrix(object):
     __slots__ = ["access_token", "homeserver", "room_id", "events"]
@@ -13,7 +15,7 @@ class Matrix(object):
     def __init__(self, username: str, password: str, homeserver: str, room_id: str, events: list):
         self.homeserver = homeserver
         self.room_id = quote(room_id)
-        self.events = [str(e) for e in events]
+        self.events = frozenset(str(e) for e in events)
 
         body = requests.post(
             url=f"https://{self.homeserver}/_matrix/client/r0/login",
@@ -27,7 +29,7 @@ class Matrix(object):
         self.access_token = body.get("access_token")
 
         if not self.access_token:
-            logging.getLogger(__name__).info("Invalid Matrix password provided. Notifications will not be sent.")
+            logger.info("Invalid Matrix password provided. Notifications will not be sent.")
 
     def send(self, message: str, event: Events) -> None:
         if str(event) in self.events:
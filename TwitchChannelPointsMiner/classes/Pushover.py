@@ -13,7 +13,7 @@ class Pushover(object):
         self.token = token
         self. priority = priority
         self.sound = sound
-        self.events = [str(e) for e in events]
+        self.events = frozenset(str(e) for e in events)
 
     def send(self, message: str, event: Events) -> None:
         if str(event) in self.events:
@@ -13,7 +13,7 @@ class Telegram(object):
     ):
         self.chat_id = chat_id
         self.telegram_api = f"https://api.telegram.org/bot{token}/sendMessage"
-        self.events = [str(e) for e in events]
+        self.events = frozenset(str(e) for e in events)
         self.disable_notification = disable_notification
 
     def send(self, message: str, event: Events) -> None:
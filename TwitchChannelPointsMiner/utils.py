@@ -1,6 +1,8 @@
+import logging
 import platform
 import re
 import socket
+import sys
 import time
 from copy import deepcopy
 from datetime import datetime, timezone
@@ -8,10 +10,13 @@ from os import path
 from random import randrange
 
 import requests
+from colorama import Style
 from millify import millify
 
 from TwitchChannelPointsMiner.constants import USER_AGENTS, GITHUB_url
 
+logger = logging.getLogger(__name__)
+
 
 def _millify(input, precision=2):
     return millify(input, precision)
@@ -26,6 +31,30 @@ def get_streamer_index(streamers: list, channel_id) -> int:
         return -1
 
 
+def load_streamers_from_file(file_path: str) -> list:
+    with open(file_path, "r") as file:
+        names = [line.strip().lower() for line in file.read().splitlines()]
+    names = [name for name in names if name]
+    # Twitch logins are case-insensitive; dict.fromkeys keeps the file order
+    streamers = list(dict.fromkeys(names))
+    if len(streamers) < len(names):
+        logger.info(
+            f"Dropped {len(names) - len(streamers)} duplicate streamers from {file_path}"
+        )
+    return streamers
+
+
+def render_lines(lines) -> str:
+    """Join menu lines into one string, resetting colors at the end of each line."""
+    return "".join(f"{line}{Style.RESET_ALL}\n" for line in lines)
+
+
+def write_block(text: str) -> None:
+    """Write a pre-rendered block to the terminal with a single write call."""
+    sys.stdout.write(text)
+    sys.stdout.flush()
+
+
 def float_round(number, ndigits=2):
     return round(float(number), ndigits)
 
@@ -67,47 +96,53 @@ def get_user_agent(browser: str) -> str:
     # return USER_AGENTS["Android"]["App"]
 
 
+# Compiled once: remove_emoji runs on every log record when emoji are disabled
+EMOJI_PATTERN = re.compile(
+    "["
+    "\U0001F600-\U0001F64F"  # emoticons
+    "\U0001F300-\U0001F5FF"  # symbols & pictographs
+    "\U0001F680-\U0001F6FF"  # transport & map symbols
+    "\U0001F1E0-\U0001F1FF"  # flags (iOS)
+    "\U00002500-\U00002587"  # chinese char
+    "\U00002589-\U00002BEF"  # I need Unicode Character “█” (U+2588)
+    "\U00002702-\U000027B0"
+    "\U00002702-\U000027B0"
+    "\U000024C2-\U00002587"
+    "\U00002589-\U0001F251"
+    "\U0001f926-\U0001f937"
+    "\U00010000-\U0010ffff"
+    "\u2640-\u2642"
+    "\u2600-\u2B55"
+    "\u200d"
+    "\u23cf"
+    "\u23e9"
+    "\u231a"
+    "\ufe0f"  # dingbats
+    "\u3030"
+    "\u231b"
+    "\u2328"
+    "\u23cf"
+    "\u23e9"
+    "\u23ea"
+    "\u23eb"
+    "\u23ec"
+    "\u23ed"
+    "\u23ee"
+    "\u23ef"
+    "\u23f0"
+    "\u23f1"
+    "\u23f2"
+    "\u23f3"
+    "]+",
+    flags=re.UNICODE,
+)
+
+
 def remove_emoji(string: str) -> str:
-    emoji_pattern = re.compile(
-        "["
-        "\U0001F600-\U0001F64F"  # emoticons
-        "\U0001F300-\U0001F5FF"  # symbols & pictographs
-        "\U0001F680-\U0001F6FF"  # transport & map symbols
-        "\U0001F1E0-\U0001F1FF"  # flags (iOS)
-        "\U00002500-\U00002587"  # chinese char
-        "\U00002589-\U00002BEF"  # I need Unicode Character “█” (U+2588)
-        "\U00002702-\U000027B0"
-        "\U00002702-\U000027B0"
-        "\U000024C2-\U00002587"
-        "\U00002589-\U0001F251"
-        "\U0001f926-\U0001f937"
-        "\U00010000-\U0010ffff"
-        "\u2640-\u2642"
-        "\u2600-\u2B55"
-        "\u200d"
-        "\u23cf"
-        "\u23e9"
-        "\u231a"
-        "\ufe0f"  # dingbats
-        "\u3030"
-        "\u231b"
-        "\u2328"
-        "\u23cf"
-        "\u23e9"
-        "\u23ea"
-        "\u23eb"
-        "\u23ec"
-        "\u23ed"
-        "\u23ee"
-        "\u23ef"
-        "\u23f0"
-        "\u23f1"
-        "\u23f2"
-        "\u23f3"
-        "]+",
-        flags=re.UNICODE,
-    )
-    return emoji_pattern.sub(r"", string)
+    # Every range in EMOJI_PATTERN is outside ASCII, and isascii() is O(1)
+    if string.isascii():
+        return string
+    return EMOJI_PATTERN.sub(r"", string)
 
 
 def at_least_one_value_in_settings_is(items, attr, value=True):
@@ -17,10 +17,27 @@ from dotenv import load_dotenv
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from TwitchChannelPointsMiner.classes.DatabaseManager import DatabaseManager
+from TwitchChannelPointsMiner.utils import render_lines, write_block
 
 # Initialize colorama for colored output
 init(autoreset=True)
 
+MAIN_MENU = render_lines([
+    "\n" + "="*60,
+    Fore.CYAN + "  Campaign Manager",
+    "="*60,
+    Fore.GREEN + "  [1] View All Campaigns",
+    Fore.GREEN + "  [2] View Campaign Details",
+    Fore.GREEN + "  [3] Add New Campaign",
+    Fore.YELLOW + "  [4] View Accounts with Drops",
+    Fore.YELLOW + "  [5] Mark Accounts as Sold",
+    Fore.YELLOW + "  [6] View Sold Accounts",
+    Fore.CYAN + "  [7] Campaign Progress Report",
+    Fore.CYAN + "  [8] Export Account Data",
+    Fore.RED + "  [9] Exit",
+    "="*60,
+])
+
 class CampaignManagerCLI:
     """CLI tool for managing campaigns and account tracking."""
     
@@ -35,19 +52,7 @@ class CampaignManagerCLI:
     
     def display_menu(self):
         """Display main menu."""
-        print("\n" + "="*60)
-        print(Fore.CYAN + "  Campaign Manager")
-        print("="*60)
-        print(Fore.GREEN + "  [1] View All Campaigns")
-        print(Fore.GREEN + "  [2] View Campaign Details")
-        print(Fore.GREEN + "  [3] Add New Campaign")
-        print(Fore.YELLOW + "  [4] View Accounts with Drops")
-        print(Fore.YELLOW + "  [5] Mark Accounts as Sold")
-        print(Fore.YELLOW + "  [6] View Sold Accounts")
-        print(Fore.CYAN + "  [7] Campaign Progress Report")
-        print(Fore.CYAN + "  [8] Export Account Data")
-        print(Fore.RED + "  [9] Exit")
-        print("="*60)
+        write_block(MAIN_MENU)
     
     def view_campaigns(self):
         """View all campaigns."""
@@ -155,19 +160,19 @@ class CampaignManagerCLI:
             print(Fore.YELLOW + "\nNo accounts with completed campaigns found.")
             return
         
-        print("\n" + Fore.CYAN + "Accounts with Completed Campaigns:")
-        print("="*80)
+        lines = ["\n" + Fore.CYAN + "Accounts with Completed Campaigns:", "="*80]
         
         for idx, account in enumerate(accounts[:30], 1):
-            print(Fore.GREEN + f"\n[{idx}] {account['username']}")
-            print(Fore.WHITE + f"    Campaigns: {', '.join(account['campaigns_completed'])}")
-            print(Fore.YELLOW + f"    Total Drops: {account['total_drops']}")
-            print(Fore.CYAN + f"    Status: {account['account_status']}")
+            lines.append(Fore.GREEN + f"\n[{idx}] {account['username']}")
+            lines.append(Fore.WHITE + f"    Campaigns: {', '.join(account['campaigns_completed'])}")
+            lines.append(Fore.YELLOW + f"    Total Drops: {account['total_drops']}")
+            lines.append(Fore.CYAN + f"    Status: {account['account_status']}")
         
         if len(accounts) > 30:
-            print(Fore.WHITE + f"\n... and {len(accounts) - 30} more accounts")
+            lines.append(Fore.WHITE + f"\n... and {len(accounts) - 30} more accounts")
         
-        print("="*80)
+        lines.append("="*80)
+        write_block(render_lines(lines))
         return accounts
     
     def mark_accounts_sold(self):
@@ -265,8 +270,11 @@ class CampaignManagerCLI:
         total_completed = 0
         total_drops = 0
         
+        # Stats for every campaign, fetched concurrently
+        all_stats = self.db.get_campaign_stats_many([c['id'] for c in campaigns])
+        
         for campaign in campaigns:
-            stats = self.db.get_campaign_stats(campaign['id'])
+            stats = all_stats[campaign['id']]
             
             print(Fore.GREEN + f"\n{campaign['campaign_name']} ({campaign['game_name']})")
             print("-" * 40)
@@ -295,6 +303,24 @@ class CampaignManagerCLI:
         print(f"Total Completed Campaigns: {total_completed}")
         print(f"Total Estimated Drops Claimed: {total_drops}")
     
+    @staticmethod
+    def _export_rows(accounts):
+        """Yield one CSV row per account campaign progress entry."""
+        for account in accounts:
+            username = account['username']
+            account_status = account.get('account_status', 'available')
+            is_sold = account.get('is_sold', False)
+            
+            # Write campaign progress
+            if account.get('account_campaign_progress'):
+                for progress in account['account_campaign_progress']:
+                    campaign_name = progress.get('campaigns', {}).get('campaign_name', 'Unknown')
+                    status = progress.get('status', 'N/A')
+                    drops = progress.get('drops_claimed', 0)
+                    yield [username, account_status, is_sold, campaign_name, status, drops]
+            else:
+                yield [username, account_status, is_sold, 'None', 'N/A', 0]
+    
     def export_account_data(self):
         """Export account and campaign data to CSV."""
         import csv
@@ -310,21 +336,7 @@ class CampaignManagerCLI:
             with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
                 writer = csv.writer(csvfile)
                 writer.writerow(['Username', 'Account Status', 'Is Sold', 'Campaign', 'Campaign Status', 'Drops Claimed'])
-                
-                for account in response.data:
-                    username = account['username']
-                    account_status = account.get('account_status', 'available')
-                    is_sold = account.get('is_sold', False)
-                    
-                    # Write campaign progress
-                    if account.get('account_campaign_progress'):
-                        for progress in account['account_campaign_progress']:
-                            campaign_name = progress.get('campaigns', {}).get('campaign_name', 'Unknown')
-                            status = progress.get('status', 'N/A')
-                            drops = progress.get('drops_claimed', 0)
-                            writer.writerow([username, account_status, is_sold, campaign_name, status, drops])
-                    else:
-                        writer.writerow([username, account_status, is_sold, 'None', 'N/A', 0])
+                writer.writerows(self._export_rows(response.data))
             
             print(Fore.GREEN + f"\nData exported successfully to: {filename}")
             
@@ -183,6 +183,39 @@ BEGIN
 END;
 $$ LANGUAGE plpgsql;
 
+-- Function to get accounts with drops in a single round trip
+-- (campaign names and drop totals are aggregated server-side)
+CREATE OR REPLACE FUNCTION accounts_with_drops_agg(p_exclude_sold BOOLEAN DEFAULT true)
+RETURNS TABLE(
+    id INTEGER,
+    username TEXT,
+    campaigns_completed TEXT[],
+    total_drops INTEGER,
+    account_status TEXT,
+    is_sold BOOLEAN
+) AS $$
+    SELECT 
+        a.id::INTEGER,
+        a.username::TEXT,
+        ARRAY_AGG(
+            COALESCE(c.campaign_name, 'Unknown') || ' (' || COALESCE(acp.drops_claimed, 0) || ' drops)'
+            ORDER BY c.campaign_name
+        ) as campaigns_completed,
+        COALESCE(SUM(acp.drops_claimed), 0)::INTEGER as total_drops,
+        COALESCE(a.account_status, 'available')::TEXT as account_status,
+        COALESCE(a.is_sold, false) as is_sold
+    FROM twitch_accounts_nodrops a
+    INNER JOIN account_campaign_progress acp ON a.id = acp.account_id
+    LEFT JOIN campaigns c ON acp.campaign_id = c.id
+    WHERE acp.status = 'completed'
+        AND (
+            NOT p_exclude_sold
+            OR (COALESCE(a.is_sold, false) = false AND a.account_status = 'available')
+        )
+    GROUP BY a.id, a.username, a.account_status, a.is_sold
+    ORDER BY total_drops DESC;
+$$ LANGUAGE sql STABLE;
+
 -- Function to get account campaign history
 CREATE OR REPLACE FUNCTION get_account_history(p_account_id INTEGER)
 RETURNS TABLE(
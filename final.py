@@ -1,6 +1,28 @@
 # -*- coding: utf-8 -*-
 
 import logging
+import os
+import sys
+
+# Usage: python final.py [username] [streamer file] - anything missing is asked for interactively.
+# The streamer file can also come from the STREAMERS_FILE environment variable.
+usernamedata = sys.argv[1] if len(sys.argv) > 1 else input("What is the username?: ")
+filename = (sys.argv[2] if len(sys.argv) > 2 else os.getenv("STREAMERS_FILE")) or input("Where would you like to pull the streamers from?:")
+
+# Read the streamer list before building the miner, so a bad filename fails
+# before the connectivity/version checks run
+try:
+    with open(filename, "r") as file:
+        # Same as utils.load_streamers_from_file, inlined because the package
+        # is only imported below, once the file is known to be usable
+        names = (line.strip().lower() for line in file.read().splitlines())
+        streamer_usernames = list(dict.fromkeys(name for name in names if name))
+except FileNotFoundError:
+    print(f"Error: The file '{filename}' was not found.")
+    exit(1) # Exit if file does not exist
+
+# The miner package pulls in requests, websocket-client, etc. - only import it
+# once we know the streamer file is usable
 from colorama import Fore
 from TwitchChannelPointsMiner import TwitchChannelPointsMiner
 from TwitchChannelPointsMiner.logger import LoggerSettings, ColorPalette
@@ -13,9 +35,8 @@ from TwitchChannelPointsMiner.classes.Pushover import Pushover
 from TwitchChannelPointsMiner.classes.Gotify import Gotify
 from TwitchChannelPointsMiner.classes.Settings import Priority, Events, FollowersOrder
 from TwitchChannelPointsMiner.classes.entities.Bet import Strategy, BetSettings, Condition, OutcomeKeys, FilterCondition, DelayMode
-from TwitchChannelPointsMiner.classes.entities.Streamer import Streamer, StreamerSettings
-usernamedata = input("What is the username?: ")
-filename = input("Where would you like to pull the streamers from?:")
+from TwitchChannelPointsMiner.classes.entities.Streamer import StreamerSettings
+
 twitch_miner = TwitchChannelPointsMiner(
     username=usernamedata,
     password="write-your-secure-psw",           # If no password will be provided, the script will ask interactively
@@ -119,19 +140,8 @@ twitch_miner = TwitchChannelPointsMiner(
 
 
 
-try:
-	with open(filename, "r") as file:
-		streamer_usernames = [line.strip() for line in file]
-except FileNotFoundError:
-	print(f"Error: The file '{filename}' was not found.")
-	exit(1) # Exit if file does not exist
-
-
-streamers = [Streamer(username) if i < 5 else username for i, username in enumerate(streamer_usernames)]
-
-
 twitch_miner.mine(
-    streamers,                          # Use the list of streamers from a file
+    streamer_usernames,                 # Use the list of streamers from a file (mine() builds the Streamer objects)
     followers=False,                    # Automatic download the list of your followers
     followers_order=FollowersOrder.ASC  # Sort the followers list by follow date. ASC or DESC
 )
@@ -1,6 +1,9 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import copy
+import functools
+import itertools
 import logging
 import sys
 import os
@@ -17,11 +20,18 @@ from TwitchChannelPointsMiner import TwitchChannelPointsMiner
 from TwitchChannelPointsMiner.logger import LoggerSettings, ColorPalette
 from TwitchChannelPointsMiner.classes.Chat import ChatPresence
 from TwitchChannelPointsMiner.classes.Settings import Priority, Events, FollowersOrder
-from TwitchChannelPointsMiner.classes.entities.Streamer import Streamer, StreamerSettings
+from TwitchChannelPointsMiner.classes.entities.Streamer import StreamerSettings
 from TwitchChannelPointsMiner.classes.DatabaseManager import DatabaseManager
 from TwitchChannelPointsMiner.classes.Discord import Discord
+from TwitchChannelPointsMiner.utils import load_streamers_from_file, render_lines, write_block
 from dotenv import load_dotenv
 
+# orjson parses noticeably faster than the stdlib decoder; use it when installed
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 # Load environment variables
 load_dotenv()
 
@@ -57,6 +67,75 @@ if not debug_mode:
     logging.getLogger("TwitchChannelPointsMiner.classes").setLevel(logging.INFO)
     logging.getLogger("TwitchChannelPointsMiner.classes.DatabaseManager").setLevel(logging.INFO)
 
+# Settings shared by every miner the launcher creates; only the username and
+# Discord config differ between instances, so they are built once here.
+# LoggerSettings is copied per miner because configure_loggers() writes to it.
+LOGGER_SETTINGS_TEMPLATE = LoggerSettings(
+    save=True,
+    console_level=log_level,
+    console_username=True,
+    auto_clear=True,
+    file_level=log_level,
+    emoji=True,
+    less=False,
+    colored=True,
+    color_palette=ColorPalette(
+        STREAMER_online="GREEN",
+        streamer_offline="red",
+        BET_wiN=Fore.MAGENTA
+    ),
+    discord=None
+)
+
+STREAMER_SETTINGS = StreamerSettings(
+    make_predictions=False,
+    follow_raid=True,
+    claim_drops=True,
+    claim_moments=False,
+    watch_streak=False,
+    community_goals=False,
+    chat=ChatPresence.ONLINE
+)
+
+@functools.lru_cache(maxsize=1)
+def cookies_dir():
+    """Return the cookies directory, creating it on first use."""
+    path = Path.cwd() / "cookies"
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+def safe_print(text):
+    """Print, ignoring a terminal that has gone away (writes fail with EIO after SIGHUP)."""
+    try:
+        print(text)
+    except OSError:
+        pass
+
+CAMPAIGNS_FILE = "campaigns.json"
+
+# Parsed campaigns.json, keyed by (mtime_ns, size) of the file it came from
+_campaign_config_cache = {}
+
+# The mode selection menu never changes, render it once
+MODE_MENU = render_lines([
+    "\n" + "="*50,
+    Fore.CYAN + "  Twitch Drop Miner - Account Mode Selection",
+    "="*50,
+    "",
+    Fore.GREEN + "  [1] Manual Mode",
+    Fore.WHITE + "      - Choose account username manually",
+    Fore.WHITE + "      - Activate manually if needed",
+    "",
+    Fore.YELLOW + "  [2] Auto Mode",
+    Fore.WHITE + "      - Automatic account from database",
+    Fore.WHITE + "      - Automatic token injection",
+    Fore.WHITE + "      - Account status tracking",
+    "",
+    Fore.RED + "  [3] Exit",
+    "",
+    "="*50,
+])
+
 class AutomaticMinerLauncher:
     """Launcher for automatic Twitch miner with database integration."""
     
@@ -68,22 +147,7 @@ class AutomaticMinerLauncher:
         
     def display_menu(self):
         """Display the mode selection menu."""
-        print("\n" + "="*50)
-        print(Fore.CYAN + "  Twitch Drop Miner - Account Mode Selection")
-        print("="*50)
-        print()
-        print(Fore.GREEN + "  [1] Manual Mode")
-        print(Fore.WHITE + "      - Choose account username manually")
-        print(Fore.WHITE + "      - Activate manually if needed")
-        print()
-        print(Fore.YELLOW + "  [2] Auto Mode")
-        print(Fore.WHITE + "      - Automatic account from database")
-        print(Fore.WHITE + "      - Automatic token injection")
-        print(Fore.WHITE + "      - Account status tracking")
-        print()
-        print(Fore.RED + "  [3] Exit")
-        print()
-        print("="*50)
+        write_block(MODE_MENU)
         
     def get_mode_selection(self):
         """Get user's mode selection."""
@@ -109,8 +173,7 @@ class AutomaticMinerLauncher:
             
             if os.path.isfile(filename):
                 try:
-                    with open(filename, "r") as file:
-                        streamer_usernames = [line.strip() for line in file if line.strip()]
+                    streamer_usernames = load_streamers_from_file(filename)
                     
                     if streamer_usernames:
                         print(Fore.GREEN + f"  Loaded {len(streamer_usernames)} streamers from {filename}")
@@ -141,24 +204,27 @@ class AutomaticMinerLauncher:
         print(Fore.GREEN + f"\n  Starting manual mining for {username}...")
         print(Fore.YELLOW + "  You may need to activate your account manually if prompted.")
         
-        # Convert streamer list to Streamer objects (first 5 get priority)
-        streamer_objects = [
-            Streamer(username) if i < 5 else username 
-            for i, username in enumerate(streamers)
-        ]
-        
         # Start mining
         self.miner.mine(
-            streamer_objects,
+            streamers,                  # Plain usernames - mine() wraps them in Streamer with the default settings
             followers=False,
             followers_order=FollowersOrder.ASC
         )
     
     def load_campaign_config(self):
-        """Load campaign configuration from JSON file."""
+        """Load campaign configuration from JSON file (cached until the file changes)."""
         try:
-            with open('campaigns.json', 'r') as f:
-                return json.load(f)
+            st = os.stat(CAMPAIGNS_FILE)
+            key = (st.st_mtime_ns, st.st_size)
+            if _campaign_config_cache.get('key') == key:
+                return _campaign_config_cache['config']
+            
+            with open(CAMPAIGNS_FILE, 'rb') as f:
+                config = json_loads(f.read())
+            
+            _campaign_config_cache['key'] = key
+            _campaign_config_cache['config'] = config
+            return config
         except FileNotFoundError:
             print(Fore.YELLOW + "  campaigns.json not found, creating default...")
             return {}
@@ -205,30 +271,38 @@ class AutomaticMinerLauncher:
     
     def display_campaign_menu(self, campaigns):
         """Display campaign selection menu."""
-        print("\n" + "="*50)
-        print(Fore.CYAN + "  Available Campaigns (Auto-Detected)")
-        print("="*50)
-        print()
+        lines = [
+            "\n" + "="*50,
+            Fore.CYAN + "  Available Campaigns (Auto-Detected)",
+            "="*50,
+            "",
+        ]
         
         if not campaigns:
-            print(Fore.RED + "  No campaign files found!")
-            print(Fore.YELLOW + "  Add .txt files and configure in campaigns.json")
+            lines.append(Fore.RED + "  No campaign files found!")
+            lines.append(Fore.YELLOW + "  Add .txt files and configure in campaigns.json")
+            write_block(render_lines(lines))
             return
         
+        # Stats for every campaign, fetched concurrently
+        all_stats = self.db_manager.get_campaign_stats_many([c['id'] for c in campaigns])
+        
         for idx, campaign in enumerate(campaigns, 1):
-            # Get stats for this campaign
-            stats = self.db_manager.get_campaign_stats(campaign['id'])
+            stats = all_stats[campaign['id']]
             
-            print(Fore.GREEN + f"  [{idx}] {campaign['campaign_name']} ({campaign['game_name']})")
-            print(Fore.WHITE + f"      File: {campaign['streamer_file']}")
-            print(Fore.YELLOW + f"      Expected drops: {campaign['expected_drops']}")
-            print(Fore.CYAN + f"      Available: {stats['available']} | Completed: {stats['completed']}")
-        
-        print()
-        print(Fore.YELLOW + f"  [A] Account Management")
-        print(Fore.RED + f"  [B] Back to Main Menu")
-        print()
-        print("="*50)
+            lines.append(Fore.GREEN + f"  [{idx}] {campaign['campaign_name']} ({campaign['game_name']})")
+            lines.append(Fore.WHITE + f"      File: {campaign['streamer_file']}")
+            lines.append(Fore.YELLOW + f"      Expected drops: {campaign['expected_drops']}")
+            lines.append(Fore.CYAN + f"      Available: {stats['available']} | Completed: {stats['completed']}")
+        
+        lines.extend([
+            "",
+            Fore.YELLOW + "  [A] Account Management",
+            Fore.RED + "  [B] Back to Main Menu",
+            "",
+            "="*50,
+        ])
+        write_block(render_lines(lines))
     
     def select_campaign(self, campaigns):
         """Get user's campaign selection."""
@@ -259,18 +333,47 @@ class AutomaticMinerLauncher:
         """Display statistics for a specific campaign."""
         stats = self.db_manager.get_campaign_stats(campaign_id)
         
-        print("\n" + "="*50)
-        print(Fore.CYAN + f"  Campaign: {campaign_name}")
-        print("="*50)
-        print(Fore.WHITE + f"  Total Accounts: {stats['total_accounts']}")
-        print(Fore.GREEN + f"  Available: {stats['available']}")
-        print(Fore.YELLOW + f"  In Progress: {stats['in_progress']}")
-        print(Fore.CYAN + f"  Partial: {stats['partial']}")
-        print(Fore.GREEN + f"  Completed: {stats['completed']}")
-        print(Fore.WHITE + f"  Not Started: {stats['not_started']}")
+        lines = [
+            "\n" + "="*50,
+            Fore.CYAN + f"  Campaign: {campaign_name}",
+            "="*50,
+            Fore.WHITE + f"  Total Accounts: {stats['total_accounts']}",
+            Fore.GREEN + f"  Available: {stats['available']}",
+            Fore.YELLOW + f"  In Progress: {stats['in_progress']}",
+            Fore.CYAN + f"  Partial: {stats['partial']}",
+            Fore.GREEN + f"  Completed: {stats['completed']}",
+            Fore.WHITE + f"  Not Started: {stats['not_started']}",
+        ]
         if stats['sold_with_campaign'] > 0:
-            print(Fore.RED + f"  Sold with this campaign: {stats['sold_with_campaign']}")
-        print("="*50)
+            lines.append(Fore.RED + f"  Sold with this campaign: {stats['sold_with_campaign']}")
+        lines.append("="*50)
+        write_block(render_lines(lines))
+    
+    def render_accounts_menu(self, accounts, limit=20):
+        """Render the account management menu for the given accounts."""
+        lines = [
+            "\n" + "="*50,
+            Fore.CYAN + "  Account Management",
+            "="*50,
+            "",
+        ]
+        
+        for idx, account in enumerate(itertools.islice(accounts, limit), 1):
+            lines.append(Fore.GREEN + f"  [{idx}] {account['username']}")
+            lines.append(Fore.WHITE + f"      Campaigns: {', '.join(account['campaigns_completed'])}")
+            lines.append(Fore.YELLOW + f"      Total drops: {account['total_drops']}")
+        
+        if len(accounts) > limit:
+            lines.append(Fore.WHITE + f"\n  ... and {len(accounts) - limit} more accounts")
+        
+        lines.extend([
+            "",
+            Fore.YELLOW + "  [M] Mark account(s) as sold",
+            Fore.RED + "  [B] Back",
+            "",
+            "="*50,
+        ])
+        return render_lines(lines)
     
     def manage_accounts_menu(self):
         """Display account management menu."""
@@ -281,38 +384,32 @@ class AutomaticMinerLauncher:
             input(Fore.CYAN + "\n  Press Enter to continue...")
             return
         
+        # The menu only changes when the account list does, so it is rendered
+        # once and rewritten as-is on every redraw
+        menu = None
+        
         while True:
-            print("\n" + "="*50)
-            print(Fore.CYAN + "  Account Management")
-            print("="*50)
-            print()
-            
-            for idx, account in enumerate(accounts[:20], 1):  # Show first 20
-                campaigns_str = ", ".join(account['campaigns_completed'])
-                print(Fore.GREEN + f"  [{idx}] {account['username']}")
-                print(Fore.WHITE + f"      Campaigns: {campaigns_str}")
-                print(Fore.YELLOW + f"      Total drops: {account['total_drops']}")
-            
-            if len(accounts) > 20:
-                print(Fore.WHITE + f"\n  ... and {len(accounts) - 20} more accounts")
-            
-            print()
-            print(Fore.YELLOW + "  [M] Mark account(s) as sold")
-            print(Fore.RED + "  [B] Back")
-            print()
-            print("="*50)
+            if menu is None:
+                menu = self.render_accounts_menu(accounts)
+            write_block(menu)
             
             choice = input(Fore.CYAN + "\n  Select option: ").strip().upper()
             
             if choice == 'B':
                 break
             elif choice == 'M':
-                self.mark_accounts_sold_menu(accounts)
+                if self.mark_accounts_sold_menu(accounts):
+                    # Accounts changed, refresh the cached list once
+                    accounts = self.db_manager.get_accounts_with_drops(exclude_sold=True)
+                    menu = None
+                    if not accounts:
+                        print(Fore.YELLOW + "\n  No accounts with completed campaigns left.")
+                        break
             else:
                 print(Fore.RED + "\n  Invalid choice.")
     
     def mark_accounts_sold_menu(self, accounts):
-        """Menu for marking accounts as sold."""
+        """Menu for marking accounts as sold. Returns the number of accounts marked."""
         print("\n" + "="*50)
         print(Fore.YELLOW + "  Mark Accounts as Sold")
         print("="*50)
@@ -324,7 +421,7 @@ class AutomaticMinerLauncher:
         selection = input(Fore.CYAN + "  Enter selection (or 'cancel'): ").strip()
         
         if selection.lower() == 'cancel':
-            return
+            return 0
         
         account_ids = []
         if selection.upper() == 'ALL':
@@ -335,11 +432,11 @@ class AutomaticMinerLauncher:
                 account_ids = [accounts[i]['id'] for i in indices if 0 <= i < len(accounts)]
             except (ValueError, IndexError):
                 print(Fore.RED + "\n  Invalid selection.")
-                return
+                return 0
         
         if not account_ids:
             print(Fore.RED + "\n  No valid accounts selected.")
-            return
+            return 0
         
         # Confirmation
         print(Fore.YELLOW + f"\n  About to mark {len(account_ids)} account(s) as sold.")
@@ -347,7 +444,7 @@ class AutomaticMinerLauncher:
         
         if confirm != 'CONFIRM':
             print(Fore.GREEN + "\n  Operation cancelled.")
-            return
+            return 0
         
         # Get reason and notes
         reason = input(Fore.CYAN + "\n  Reason for disposal (optional): ").strip() or None
@@ -361,6 +458,7 @@ class AutomaticMinerLauncher:
         
         print(Fore.GREEN + f"\n  Successfully marked {success_count}/{len(account_ids)} accounts as sold.")
         input(Fore.CYAN + "\n  Press Enter to continue...")
+        return success_count
     
     def run_auto_mode(self):
         """Run the miner in automatic mode with database integration and campaign selection."""
@@ -444,8 +542,7 @@ class AutomaticMinerLauncher:
         # Get streamers list - use campaign's streamer file if available
         if campaign.get('streamer_file') and os.path.isfile(campaign['streamer_file']):
             print(Fore.GREEN + f"\n  Using campaign streamer file: {campaign['streamer_file']}")
-            with open(campaign['streamer_file'], 'r') as f:
-                streamers = [line.strip() for line in f if line.strip()]
+            streamers = load_streamers_from_file(campaign['streamer_file'])
         else:
             # Fallback to manual file selection
             streamers = self.get_streamers_file()
@@ -462,9 +559,7 @@ class AutomaticMinerLauncher:
         # Inject token directly
         print(Fore.YELLOW + f"  Injecting token for {username}...")
         
-        cookies_path = os.path.join(Path().absolute(), "cookies")
-        Path(cookies_path).mkdir(parents=True, exist_ok=True)
-        cookies_file = os.path.join(cookies_path, f"{username}.pkl")
+        cookies_file = cookies_dir() / f"{username}.pkl"
         
         # Inject the token
         success = self.miner.twitch.twitch_login.inject_token(
@@ -489,18 +584,12 @@ class AutomaticMinerLauncher:
         print(Fore.CYAN + f"  Campaign: {campaign_name}")
         print(Fore.CYAN + f"  Streamers: {len(streamers)}")
         
-        # Convert streamer list to Streamer objects
-        streamer_objects = [
-            Streamer(username) if i < 5 else username 
-            for i, username in enumerate(streamers)
-        ]
-        
         # Start mining
         try:
             # The cookie file was created by inject_token, so login() will load it
             # and use the existing token instead of starting device flow
             self.miner.mine(
-                streamer_objects,
+                streamers,              # Plain usernames - mine() wraps them in Streamer with the default settings
                 followers=False,
                 followers_order=FollowersOrder.ASC
             )
@@ -523,11 +612,6 @@ class AutomaticMinerLauncher:
     
     def create_miner_instance(self, username, auto_mode=False):
         """Create a TwitchChannelPointsMiner instance with common settings."""
-        # Get debug mode from environment
-        debug_mode = os.getenv("DEBUG", "false").lower() == "true"
-        console_log_level = logging.DEBUG if debug_mode else logging.INFO
-        file_log_level = logging.DEBUG if debug_mode else logging.INFO
-        
         # Get Discord webhook from environment
         discord_webhook = os.getenv("DISCORD_WEBHOOK")
         
@@ -556,6 +640,9 @@ class AutomaticMinerLauncher:
             )
             print(Fore.GREEN + f"  Discord webhook configured (Debug: {debug_mode}, Events: {len(events)})")
         
+        logger_settings = copy.copy(LOGGER_SETTINGS_TEMPLATE)
+        logger_settings.discord = discord_config
+        
         return TwitchChannelPointsMiner(
             username=username,
             password=None,  # Not used in auto mode
@@ -566,44 +653,23 @@ class AutomaticMinerLauncher:
             ],
             enable_analytics=False,  # Can be enabled if needed
             disable_ssl_cert_verification=False,
-            logger_settings=LoggerSettings(
-                save=True,
-                console_level=console_log_level,  # Use dynamic level
-                console_username=True,
-                auto_clear=True,
-                file_level=file_log_level,  # Use dynamic level
-                emoji=True,
-                less=False,
-                colored=True,
-                color_palette=ColorPalette(
-                    STREAMER_online="GREEN",
-                    streamer_offline="red",
-                    BET_wiN=Fore.MAGENTA
-                ),
-                discord=discord_config  # Add Discord config here
-            ),
-            streamer_settings=StreamerSettings(
-                make_predictions=False,
-                follow_raid=True,
-                claim_drops=True,
-                claim_moments=False,
-                watch_streak=False,
-                community_goals=False,
-                chat=ChatPresence.ONLINE
-            )
+            logger_settings=logger_settings,
+            streamer_settings=STREAMER_SETTINGS
         )
     
     def cleanup(self):
         """Clean up resources on exit."""
         if self.db_manager and self.current_account:
-            print(Fore.YELLOW + "\n  Cleaning up...")
+            safe_print(Fore.YELLOW + "\n  Cleaning up...")
             # Release account back to available pool
             self.db_manager.release_account(self.current_account['id'])
-            print(Fore.GREEN + "  Account released back to pool")
+            self.current_account = None
+            safe_print(Fore.GREEN + "  Account released back to pool")
     
     def signal_handler(self, signum, frame):
         """Handle shutdown signals gracefully."""
-        print(Fore.YELLOW + "\n  Shutdown signal received...")
+        # The terminal may already be gone (SIGHUP), so output must not stop the release
+        safe_print(Fore.YELLOW + "\n  Shutdown signal received...")
         self.cleanup()
         if self.miner:
             self.miner.end(signum, frame)
@@ -618,6 +684,10 @@ class AutomaticMinerLauncher:
         # Set up signal handlers for graceful shutdown
         signal.signal(signal.SIGINT, self.signal_handler)
         signal.signal(signal.SIGTERM, self.signal_handler)
+        # Closing the terminal (e.g. a dropped SSH session) must release the
+        # account too, otherwise it stays in_use until the orphan cleanup runs
+        if hasattr(signal, "SIGHUP"):
+            signal.signal(signal.SIGHUP, self.signal_handler)
         
         try:
             # Get mode selection
@@ -630,10 +700,10 @@ class AutomaticMinerLauncher:
                 self.run_auto_mode()
                 
         except KeyboardInterrupt:
-            print(Fore.YELLOW + "\n  Interrupted by user")
+            safe_print(Fore.YELLOW + "\n  Interrupted by user")
             self.cleanup()
         except Exception as e:
-            print(Fore.RED + f"\n  Error: {e}")
+            safe_print(Fore.RED + f"\n  Error: {e}")
             logger.exception("Unexpected error in launcher")
             self.cleanup()
             sys.exit(1)
@@ -1,5 +1,4 @@
 import logging
-import os
 from colorama import Fore
 from TwitchChannelPointsMiner import TwitchChannelPointsMiner
 from TwitchChannelPointsMiner.logger import LoggerSettings, ColorPalette
@@ -9,11 +8,7 @@ from TwitchChannelPointsMiner.classes.Telegram import Telegram
 from TwitchChannelPointsMiner.classes.Settings import Priority, Events, FollowersOrder
 from TwitchChannelPointsMiner.classes.entities.Bet import Strategy, BetSettings, Condition, OutcomeKeys, FilterCondition, DelayMode
 from TwitchChannelPointsMiner.classes.entities.Streamer import Streamer, StreamerSettings
-
-# Function to load streamers from a file
-def load_streamers_from_file(file_path):
-    with open(file_path, "r") as file:
-        return [line.strip() for line in file.readlines()]
+from TwitchChannelPointsMiner.utils import load_streamers_from_file
 
 # Function to check if a streamer is playing Rust
 def is_streamer_playing_rust(streamer_username):
@@ -28,8 +23,7 @@ def is_streamer_playing_rust(streamer_username):
     return False
 
 # Function to initialize the TwitchMiner
-def start_twitch_miner(username, file_path):
-    streamers_list = load_streamers_from_file(file_path)
+def start_twitch_miner(username, streamers_list):
     eligible_streamers = []
 
     # Filter streamers who are playing "Rust"
@@ -103,7 +97,9 @@ if __name__ == "__main__":
     username = input("Enter your Twitch username: ")
     file_path = input("Enter the path to your streamer list file: ")
     
-    if os.path.exists(file_path):
-        start_twitch_miner(username, file_path)
-    else:
+    try:
+        streamers_list = load_streamers_from_file(file_path)
+    except FileNotFoundError:
         print("Streamer list file not found.")
+    else:
+        start_twitch_miner(username, streamers_list)